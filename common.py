@@ -0,0 +1,300 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+import plotly.express as px
+import plotly.io as pio
+import numexpr as ne
+from numba import njit
+from data.etl import run_etl, source_version
+from models.model_store import bundle_version, load_models as read_models
+
+# ======== Load Data ========
+ETL_CACHE_DIR = "cache"
+ETL_CACHE_TTL = 3600  # seconds before the loaders check the database for new rows
+
+ETL_FRAMES = ("monthly_sales", "monthly_customer", "monthly_product")
+
+def run_etl_cached(name):
+    """Read one ETL frame back from its Parquet snapshot of the current sales_log, rerunning the ETL once rows are added"""
+    version = source_version()
+    path = os.path.join(ETL_CACHE_DIR, f"{name}-{version}.parquet")
+    if os.path.exists(path):
+        return pd.read_parquet(path)
+
+    frames = dict(zip(ETL_FRAMES, run_etl(persist_star_schema=False)))
+    os.makedirs(ETL_CACHE_DIR, exist_ok=True)
+    for stale in os.listdir(ETL_CACHE_DIR):
+        if stale.endswith(".parquet"):
+            os.remove(os.path.join(ETL_CACHE_DIR, stale))
+    for frame_name, frame in frames.items():
+        frame.to_parquet(os.path.join(ETL_CACHE_DIR, f"{frame_name}-{version}.parquet"), compression="zstd")
+    return frames[name]
+
+def group_slices(sizes):
+    """Row slice of every group in a frame sorted by key, from the group sizes in frame order"""
+    stops = sizes.cumsum().to_numpy()
+    return {group: slice(stop - size, stop) for group, size, stop in zip(sizes.index, sizes.to_numpy(), stops)}
+
+@njit(cache=True)
+def rolling_mean3(values, groups):
+    """3-month trailing mean in one compiled pass, restarted wherever groups changes; NaN until a group has 3 months"""
+    out = np.empty(values.size)
+    run = 0
+    for i in range(values.size):
+        run = run + 1 if i > 0 and groups[i] == groups[i - 1] else 1
+        out[i] = (values[i - 2] + values[i - 1] + values[i]) / 3 if run >= 3 else np.nan
+    return out
+
+def prepare_series(df, key, kind):
+    """Sort a per-customer/per-product frame by key and derive everything its page needs from it"""
+    # Keep each customer's/product's months in one contiguous block (stable sort
+    # preserves month order) so a selection can be sliced out as a view
+    df = df.sort_values(key, kind="stable", ignore_index=True)
+    # Parquet stores integer categoricals as plain integers, so restore the dtype the ETL set
+    df[key] = df[key].astype("category")
+    # 3-month moving average behind the trend chart, computed once instead of per render
+    df["MA3"] = rolling_mean3(df["TotalRevenue"].to_numpy(), df[key].cat.codes.to_numpy())
+    # Groupbys on the categorical key work on its codes; sort=False keeps the groups in
+    # frame order, which the frame's sort already makes the key order
+    groups = df.groupby(key, observed=True, sort=False)
+    sizes = groups.size()
+    # Row slice of every customer/product, so a selection is a dict lookup and a
+    # view instead of a boolean-mask scan or a gather over the whole frame
+    rows = group_slices(sizes)
+    # Next-month forecasts for every trained series, made here alongside the data they
+    # extend so reruns don't hash the frame to look them up in a separate cache
+    # MonthIndex counts each series' months from 0, so the next step is the series length
+    forecasts = forecast_all(kind, sizes)
+    # Total revenue of every customer/product, highest first, aggregated once for the
+    # selectbox options, ranks and sidebar overview instead of on every rerun
+    totals = groups["TotalRevenue"].sum().sort_values(ascending=False)
+    options = totals.index.to_numpy()
+    # Revenue rank of every customer/product, 1 for the highest
+    ranks = dict(zip(options, range(1, len(options) + 1)))
+    return df, rows, totals, options, ranks, forecasts
+
+# Each frame is cached on its own, so refreshing one doesn't evict the others
+@st.cache_data(ttl=ETL_CACHE_TTL, max_entries=1)
+def load_sales():
+    monthly_sales_df = run_etl_cached("monthly_sales")
+    monthly_sales_df["MA3"] = rolling_mean3(monthly_sales_df["TotalRevenue"].to_numpy(),
+                                            np.zeros(len(monthly_sales_df), dtype=np.int8))
+    global_next = pd.Series([monthly_sales_df["MonthIndex"].iloc[-1] + 1], index=["global"])
+    return (monthly_sales_df, forecast_all("global", global_next).get("global"),
+            sales_summary(monthly_sales_df["TotalRevenue"].to_numpy()))
+
+@st.cache_data(ttl=ETL_CACHE_TTL, max_entries=1)
+def load_customer():
+    return prepare_series(run_etl_cached("monthly_customer"), "CustomerID", "customer")
+
+@st.cache_data(ttl=ETL_CACHE_TTL, max_entries=1)
+def load_product():
+    return prepare_series(run_etl_cached("monthly_product"), "Description", "product")
+
+@st.cache_resource(max_entries=1)
+def load_models(version):
+    """Arrays of the packed model bundle (keys, coefficients and intercepts per kind), read in one open.
+
+    Keyed on the bundle's version so retraining replaces the cached arrays.
+    """
+    return read_models()
+
+def forecast_all(kind, next_index):
+    """Forecast next month for every series with a trained model in one vectorized call.
+
+    next_index holds the month index to forecast, keyed by customer/product.
+    Returns the forecasts keyed the same way; untrained series are left out.
+    """
+    models = load_models(bundle_version())
+    keys = models.get(f"{kind}_keys", np.array([]))
+    if len(keys) == 0:
+        return pd.Series(dtype="float64")
+    # Keys are stored sorted, so each series' model is found with a binary search
+    wanted = next_index.index.to_numpy()
+    rows = np.searchsorted(keys, wanted).clip(max=len(keys) - 1)
+    trained = keys[rows] == wanted
+    rows = rows[trained]
+    # NumExpr fuses the multiply-add into one multithreaded pass over all models
+    forecasts = ne.evaluate("c * x + i", local_dict={
+        "c": models[f"{kind}_coef"][rows], "i": models[f"{kind}_intercept"][rows],
+        "x": next_index.to_numpy()[trained]})
+    return pd.Series(forecasts, index=next_index.index[trained])
+
+# ======== Helper Functions ========
+def calculate_growth_metrics(values):
+    """Calculate growth metrics for the data series, given as a NumPy array"""
+    if len(values) < 2:
+        return 0, 0, "neutral"
+    
+    previous, current = values[-2:]
+    
+    if previous == 0:
+        growth_pct = 100 if current > 0 else 0
+    else:
+        growth_pct = ((current - previous) / abs(previous)) * 100
+    
+    growth_abs = current - previous
+    trend = "up" if growth_pct > 0 else "down" if growth_pct < 0 else "neutral"
+    
+    return growth_pct, growth_abs, trend
+
+MAX_CHART_POINTS = 1000
+
+def sales_summary(values):
+    """Every statistic the global page shows of a revenue series, computed together from its NumPy array"""
+    # Average monthly growth rate, skipping months that follow a zero
+    prev, curr = values[:-1], values[1:]
+    nonzero = prev != 0
+    avg_growth_rate = float(((curr[nonzero] - prev[nonzero]) / prev[nonzero] * 100).mean()) if nonzero.any() else None
+    peak_idx, low_idx = int(values.argmax()), int(values.argmin())
+    return {
+        "sum": values.sum(), "mean": values.mean(), "std": values.std(ddof=1),
+        "last": values[-1], "year_ago": values[-13] if len(values) >= 13 else None,
+        "peak_idx": peak_idx, "peak": values[peak_idx], "low_idx": low_idx, "low": values[low_idx],
+        "avg_growth_rate": avg_growth_rate,
+    }
+
+def month_label(month_num):
+    """Format an integer MonthNum (year * 12 + month - 1) as YYYY-MM"""
+    return f"{month_num // 12}-{month_num % 12 + 1:02d}"
+
+def format_large_number(num):
+    """Format large numbers in a readable way"""
+    if num >= 1_000_000:
+        return f"£{num/1_000_000:.2f}M"
+    elif num >= 1_000:
+        return f"£{num/1_000:.1f}K"
+    else:
+        return f"£{num:.2f}"
+
+def format_large_numbers(values):
+    """Format a whole array of numbers like format_large_number, without a Python call per value"""
+    values = np.asarray(values, dtype="float64")
+    return np.select(
+        [values >= 1_000_000, values >= 1_000],
+        [np.char.add(np.char.mod("£%.2f", values / 1_000_000), "M"),
+         np.char.add(np.char.mod("£%.1f", values / 1_000), "K")],
+        default=np.char.mod("£%.2f", values)
+    )
+
+def downsample_for_chart(df, y_col, max_points=MAX_CHART_POINTS):
+    """Keep only the lowest and highest row of each of max_points // 2 equal buckets (M4-style);
+    series that already fit are returned unchanged"""
+    if len(df) <= max_points:
+        return df
+    values = pd.Series(df[y_col].to_numpy())
+    buckets = values.groupby(np.arange(len(values)) * (max_points // 2) // len(values))
+    return df.iloc[np.union1d(buckets.idxmin(), buckets.idxmax())]
+
+def create_time_series_chart(df, x_col, y_col, title, color_scheme="Blues", add_trendline=True, trend_col="MA3"):
+    """Create an enhanced time series chart with trend analysis from a precomputed trend column"""
+    return pio.from_json(time_series_chart_json(df, x_col, y_col, title, color_scheme, add_trendline, trend_col))
+
+@st.cache_data(max_entries=64)
+def time_series_chart_json(df, x_col, y_col, title, color_scheme, add_trendline, trend_col):
+    """Build the time series chart as JSON, cached so reruns over the same data skip Plotly's trace construction"""
+    # Long histories are thinned before plotting so the browser only renders what it can show
+    df = downsample_for_chart(df, y_col)
+    fig = px.line(
+        df, x=x_col, y=y_col,
+        markers=True,
+        render_mode="webgl",
+        title=title,
+        color_discrete_sequence=["#0068c9"],
+        template="plotly_dark"
+    )
+    
+    # Add moving average trendline if requested and enough data points
+    if add_trendline and len(df) > 3:
+        fig.add_scattergl(
+            x=df[x_col], 
+            y=df[trend_col], 
+            mode='lines', 
+            line=dict(width=2, dash='dash', color='#FF9914'),
+            name='3-Month Trend'
+        )
+    
+    # Highlight max and min points, as one two-marker trace
+    values = df[y_col].to_numpy()
+    extrema = df.iloc[[values.argmax(), values.argmin()]]
+    
+    fig.add_scattergl(
+        x=extrema[x_col], 
+        y=extrema[y_col],
+        mode='markers',
+        marker=dict(size=12, color=['#00CC96', '#EF553B'], symbol=['star', 'x']),
+        name='Peak / Low'
+    )
+    
+    # Enhance layout
+    fig.update_layout(
+        xaxis_title="Month",
+        yaxis_title="Revenue",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        height=400,
+        hovermode="x unified"
+    )
+    
+    # Improve tooltips
+    fig.update_traces(
+        hovertemplate="<b>%{x}</b><br>Revenue: £%{y:,.2f}<extra></extra>"
+    )
+    
+    return fig.to_json()
+
+def display_metrics_card(title, value, delta, delta_description="vs previous period"):
+    """Display a metric with trend information in a styled card"""
+    if delta > 0:
+        delta_color = "normal"
+        delta_text = f"↗️ +{delta:.2f}% {delta_description}"
+    elif delta < 0:
+        delta_color = "inverse" 
+        delta_text = f"↘️ {delta:.2f}% {delta_description}"
+    else:
+        delta_color = "off"
+        delta_text = f"↔️ {delta:.2f}% {delta_description}"
+    
+    st.metric(
+        label=title,
+        value=value,
+        delta=delta_text,
+        delta_color=delta_color,
+    )
+
+# ======== Page Setup ========
+def setup_page():
+    """Apply the page settings and styling shared by every page of the dashboard"""
+    st.set_page_config(
+        page_title="Sales Forecast Dashboard",
+        page_icon="📊",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Apply custom CSS for better UI
+    st.markdown("""
+    <style>
+        div.block-container {
+            padding-top: 1rem;
+        }
+        div[data-testid="stMetricValue"] > div {
+            font-size: 24px;
+        }
+        .chart-container {
+            border: 1px solid #4B5563;
+            border-radius: 10px;
+            padding: 10px;
+            background-color: #1E1E1E;
+        }
+        .insight-container {
+            background-color: #262730;
+            padding: 15px;
+            border-radius: 5px;
+            margin-bottom: 10px;
+        }
+        .tooltip-container {
+            position: relative;
+        }
+    </style>
+    """, unsafe_allow_html=True)
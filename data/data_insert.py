@@ -1,34 +1,43 @@
 import pandas as pd
-from sqlalchemy import create_engine
-from dotenv import load_dotenv
+from sqlalchemy import text
 import os
+import sys
 import datetime
 
-# Load environment variables
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
+# Access the data package from the repository root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from data.db import bulk_copy, engine
 
-# Get data from the 'sales' table (master data)
-df = pd.read_sql("SELECT * FROM sales", con=engine)
+# Count the rows of the 'sales' table (master data)
+with engine.connect() as conn:
+    total = conn.execute(text("SELECT COUNT(*) FROM sales")).scalar()
 
 # Simulate a daily batch of 100 rows (daily rotation based on date)
 today = datetime.date.today()
-hash_id = today.toordinal() % len(df)
-start = hash_id * 100 % len(df)
-end = (start + 100) % len(df)
+hash_id = today.toordinal() % total
+start = hash_id * 100 % total
+end = (start + 100) % total
 
-# Slice batch data
-if start < end:
-    daily_data = df.iloc[start:end]
-else:
-    daily_data = pd.concat([df.iloc[start:], df.iloc[:end]])
+# The sales table has no key and the database may return its rows in a different order
+# on every scan, so both parts of the window page through it sorted on every column
+# (rows equal in all of them are interchangeable)
+row_order = '"InvoiceNo", "StockCode", "InvoiceDate", "Description", "Quantity", "UnitPrice", "CustomerID", "Country"'
+
+# Fetch only the batch rows in one query. When the window runs past the end of the
+# table, the second part wraps around to its start; otherwise it is empty
+wraps = start >= end
+daily_data = pd.read_sql(text(f"""
+    SELECT * FROM (SELECT * FROM sales ORDER BY {row_order} LIMIT :limit OFFSET :offset) AS batch
+    UNION ALL
+    SELECT * FROM (SELECT * FROM sales ORDER BY {row_order} LIMIT :wrapped) AS wrapped
+"""), engine, params={"limit": (total if wraps else end) - start, "offset": start,
+                      "wrapped": end if wraps else 0})
 
 # Add additional tracking columns
 daily_data["inserted_at"] = datetime.datetime.now()
 daily_data["source"] = "auto_simulation"
 
 # Save to sales_log
-daily_data.to_sql("sales_log", engine, if_exists="append", index=False)
+bulk_copy(daily_data, "sales_log", engine)
 
 print(f"✅ {len(daily_data)} rows inserted to 'sales_log' at {datetime.datetime.now()}")
\ No newline at end of file
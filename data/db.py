@@ -0,0 +1,48 @@
+import io
+import os
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, inspect
+
+# Load environment variables from .env file
+load_dotenv()
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# One engine (and connection pool) for every script and the dashboard, so a process
+# that runs several pipeline steps reuses warm connections instead of opening new ones
+engine = create_engine(DATABASE_URL, pool_size=8, max_overflow=16)
+
+def bulk_copy(df, table, engine, if_exists="append"):
+    """
+    Writes a DataFrame to a table, streaming it through COPY on PostgreSQL.
+
+    The table is created from the DataFrame's columns if it doesn't exist yet,
+    or recreated when if_exists is "replace". Other databases fall back to
+    to_sql with multi-row INSERTs.
+
+    Args:
+        df (pd.DataFrame): The rows to write.
+        table (str): The name of the target table.
+        engine (sqlalchemy.engine.Engine): The database to write to.
+        if_exists (str, optional): "append" or "replace". Defaults to "append".
+    """
+    if engine.dialect.name != "postgresql":
+        df.to_sql(table, engine, if_exists=if_exists, index=False, method="multi", chunksize=1000)
+        return
+
+    if if_exists == "replace" or not inspect(engine).has_table(table):
+        df.head(0).to_sql(table, engine, if_exists="replace", index=False)
+
+    buf = io.StringIO()
+    df.to_csv(buf, index=False, header=False, na_rep="\\N")
+    buf.seek(0)
+    # to_sql creates mixed-case column names, which must be quoted
+    quote = engine.dialect.identifier_preparer.quote
+    columns = ", ".join(quote(col) for col in df.columns)
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cur:
+            cur.copy_expert(f"COPY {quote(table)} ({columns}) FROM STDIN WITH CSV NULL '\\N'", buf)
+        raw.commit()
+    finally:
+        raw.close()
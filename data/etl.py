@@ -1,92 +1,152 @@
+import calendar
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
-from dotenv import load_dotenv
+from sqlalchemy import text
 import os
+import sys
 
-# Load environment variables from .env file
-load_dotenv()
-db_url = os.getenv("DATABASE_URL")
-engine = create_engine(db_url)
+# Access the data package from the repository root, also when run as a script
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from data.db import engine
+
+def source_version():
+    """
+    Returns a fingerprint of the 'sales_log' rows the ETL reads: their count and the
+    latest insert time. It only changes when rows are added, so ETL output can be
+    reused for as long as it stays the same.
+    """
+    with engine.connect() as conn:
+        count, last_insert = conn.execute(text("SELECT COUNT(*), MAX(inserted_at) FROM sales_log")).one()
+    return f"{count}-{last_insert:%Y%m%d%H%M%S%f}" if last_insert else str(count)
 
 # === ETL from sales_log to Data Warehouse ===
-def run_etl():
+def run_etl(persist_star_schema=True):
     """
     Performs an ETL (Extract, Transform, Load) process.
-    - Extracts data from the 'sales_log' table.
-    - Transforms it into a star schema (fact and dimension tables).
-    - Loads the new tables into a data warehouse.
+    - Extracts and cleans the 'sales_log' rows into a temporary staging table.
+    - Transforms them into a star schema (fact and dimension tables).
+    - Loads the new tables into the data warehouse.
+    All of it runs inside the database, in one transaction.
     - Returns three aggregated DataFrames: monthly sales, monthly sales by customer,
       and monthly sales by product.
+
+    Args:
+        persist_star_schema (bool, optional): Rebuild the warehouse tables. Callers that
+            only need the aggregates can skip it. Defaults to True.
     """
-    # EXTRACT: Read data from the source table
-    df = pd.read_sql("SELECT * FROM sales_log", engine)
+    with engine.begin() as conn:
+        # EXTRACT + TRANSFORM: Stage the cleaned rows once, server-side. Every column
+        # of the source sheet is required, and the temp table goes away with the transaction
+        conn.execute(text('''
+            CREATE TEMP TABLE f ON COMMIT DROP AS
+            SELECT
+                to_char("InvoiceDate", 'YYYY-MM-DD') AS date_id,
+                to_char(date_trunc('month', "InvoiceDate"), 'YYYY-MM') AS month,
+                CAST(EXTRACT(YEAR FROM "InvoiceDate") * 12 + EXTRACT(MONTH FROM "InvoiceDate") - 1 AS INTEGER) AS "MonthNum",
+                "InvoiceDate",
+                "CustomerID",
+                "Country",
+                "StockCode",
+                "Description",
+                "Quantity",
+                "Quantity" * "UnitPrice" AS revenue
+            FROM sales_log
+            WHERE "InvoiceNo" IS NOT NULL AND "StockCode" IS NOT NULL
+              AND "Description" IS NOT NULL AND "Quantity" IS NOT NULL
+              AND "InvoiceDate" IS NOT NULL AND "UnitPrice" IS NOT NULL
+              AND "CustomerID" IS NOT NULL AND "Country" IS NOT NULL
+        '''))
 
-    # TRANSFORM: Clean and shape the data
-    df.dropna(inplace=True)
+        # LOAD: Build the star schema (fact and dimension tables) from the staged rows
+        if persist_star_schema:
+            conn.execute(text('''
+                DROP TABLE IF EXISTS dim_date, dim_customer, dim_product, fact_sales
+            '''))
+            conn.execute(text('''
+                CREATE TABLE dim_date AS
+                SELECT
+                    date_id,
+                    "InvoiceDate",
+                    CAST(EXTRACT(YEAR FROM "InvoiceDate") AS INTEGER) AS year,
+                    month,
+                    CAST(EXTRACT(QUARTER FROM "InvoiceDate") AS INTEGER) AS quarter
+                FROM (SELECT date_id, month, MIN("InvoiceDate") AS "InvoiceDate" FROM f GROUP BY date_id, month) d
+            '''))
+            conn.execute(text('''
+                CREATE TABLE dim_customer AS SELECT DISTINCT "CustomerID", "Country" FROM f
+            '''))
+            conn.execute(text('''
+                CREATE TABLE dim_product AS SELECT DISTINCT "StockCode", "Description" FROM f
+            '''))
+            conn.execute(text('''
+                CREATE TABLE fact_sales AS
+                SELECT date_id, "CustomerID", "StockCode", "Quantity", revenue FROM f
+            '''))
 
-    # ====== Create Dimension Tables ======
-    # DIMENSION: Date
-    df["InvoiceDate"] = pd.to_datetime(df["InvoiceDate"])
-    df["date_id"] = df["InvoiceDate"].dt.date.astype(str)
-    dim_date = df[["date_id", "InvoiceDate"]].copy()
-    dim_date["year"] = dim_date["InvoiceDate"].dt.year
-    dim_date["month"] = dim_date["InvoiceDate"].dt.to_period("M").astype(str)
-    dim_date["quarter"] = dim_date["InvoiceDate"].dt.quarter
-    dim_date = dim_date.drop_duplicates(subset=["date_id"])
+        # Prepare monthly aggregates for reporting and analysis
+        # Aggregate total monthly sales
+        monthly_sales = pd.read_sql(text('''
+            SELECT
+                month AS "Month",
+                "MonthNum",
+                SUM(revenue) AS "TotalRevenue"
+            FROM f
+            GROUP BY month, "MonthNum"
+            ORDER BY month
+        '''), conn)
 
-    # DIMENSION: Customer
-    dim_customer = df[["CustomerID", "Country"]].drop_duplicates().copy()
+        # Aggregate monthly sales by customer
+        monthly_customer = pd.read_sql(text('''
+            SELECT
+                month AS "Month",
+                "MonthNum",
+                "CustomerID",
+                SUM(revenue) AS "TotalRevenue"
+            FROM f
+            GROUP BY month, "MonthNum", "CustomerID"
+            ORDER BY "CustomerID", month
+        '''), conn)
 
-    # DIMENSION: Product
-    dim_product = df[["StockCode", "Description"]].drop_duplicates().copy()
+        # Aggregate monthly sales by product (through every description of the stock code)
+        monthly_product = pd.read_sql(text('''
+            SELECT
+                f.month AS "Month",
+                f."MonthNum",
+                p."Description",
+                SUM(f.revenue) AS "TotalRevenue"
+            FROM f
+            JOIN (SELECT DISTINCT "StockCode", "Description" FROM f) p ON f."StockCode" = p."StockCode"
+            GROUP BY f.month, f."MonthNum", p."Description"
+            ORDER BY p."Description", f.month
+        '''), conn)
 
-    # ====== Create Fact Table ======
-    # Calculate revenue and select columns for the fact table
-    df["revenue"] = df["Quantity"] * df["UnitPrice"]
-    fact_sales = df[["date_id", "CustomerID", "StockCode", "Quantity", "revenue"]].copy()
+    # Store revenue as float32: charts don't need float64 precision and every rerun
+    # serializes these columns to the browser. (to_numeric(downcast="float") would keep
+    # float64, since revenue sums are rarely exact in float32)
+    for monthly in (monthly_sales, monthly_customer, monthly_product):
+        monthly["TotalRevenue"] = monthly["TotalRevenue"].astype("float32")
 
-    # LOAD: Store the new tables in the database
-    dim_date.to_sql("dim_date", engine, if_exists="replace", index=False)
-    dim_customer.to_sql("dim_customer", engine, if_exists="replace", index=False)
-    dim_product.to_sql("dim_product", engine, if_exists="replace", index=False)
-    fact_sales.to_sql("fact_sales", engine, if_exists="replace", index=False)
+    # Customers and products repeat once per month: store them as categoricals
+    # so filters, groupbys and unique() work on small integer codes
+    monthly_customer["CustomerID"] = monthly_customer["CustomerID"].astype("uint32").astype("category")
+    monthly_product["Description"] = monthly_product["Description"].astype("category")
 
-    # Prepare monthly aggregates for reporting and analysis
-    # Aggregate total monthly sales
-    monthly_sales = pd.read_sql('''
-        SELECT
-            month,
-            SUM(revenue) AS TotalRevenue
-        FROM fact_sales fs
-        JOIN dim_date dd ON fs.date_id = dd.date_id
-        GROUP BY month
-        ORDER BY month
-    ''', engine)
+    # Months as integers (year * 12 + month - 1, computed in the query rather than by
+    # parsing the "YYYY-MM" strings here), so month arithmetic and calendar lookups
+    # downstream don't need datetimes
+    for monthly in (monthly_sales, monthly_customer, monthly_product):
+        monthly["MonthNum"] = monthly["MonthNum"].astype("uint16")
 
-    # Aggregate monthly sales by customer
-    monthly_customer = pd.read_sql('''
-        SELECT
-            month,
-            CustomerID,
-            SUM(revenue) AS TotalRevenue
-        FROM fact_sales fs
-        JOIN dim_date dd ON fs.date_id = dd.date_id
-        GROUP BY month, CustomerID
-        ORDER BY CustomerID, month
-    ''', engine)
+    # Calendar columns behind the monthly distribution chart, derived here once
+    # instead of parsing the month strings into datetimes on every render
+    monthly_sales["Year"] = (monthly_sales["MonthNum"] // 12).astype("int16")
+    monthly_sales["MonthName"] = pd.Categorical.from_codes(
+        monthly_sales["MonthNum"] % 12, categories=list(calendar.month_abbr)[1:])
 
-    # Aggregate monthly sales by product
-    monthly_product = pd.read_sql('''
-        SELECT
-            month,
-            p.Description,
-            SUM(revenue) AS TotalRevenue
-        FROM fact_sales fs
-        JOIN dim_date dd ON fs.date_id = dd.date_id
-        JOIN dim_product p ON fs.StockCode = p.StockCode
-        GROUP BY month, p.Description
-        ORDER BY p.Description, month
-    ''', engine)
+    # Position of each month within its series, so the next forecast step is a lookup
+    monthly_sales["MonthIndex"] = np.arange(len(monthly_sales))
+    monthly_customer["MonthIndex"] = monthly_customer.groupby("CustomerID", observed=True).cumcount()
+    monthly_product["MonthIndex"] = monthly_product.groupby("Description", observed=True).cumcount()
 
     print("✅ ETL complete: returning 3 DataFrames")
     return monthly_sales, monthly_customer, monthly_product
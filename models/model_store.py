@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+
+MODEL_DIR = "models"
+BUNDLE_PATH = os.path.join(MODEL_DIR, "bundle.npz")
+
+def save_models(models):
+    """
+    Packs every trained model into a single .npz bundle of columnar arrays.
+
+    For each kind the bundle holds `<kind>_keys` (sorted, so lookups can use
+    np.searchsorted), `<kind>_coef` and `<kind>_intercept`.
+
+    Args:
+        models (dict): {kind: {CustomerID/Description/"global": [coefficient, intercept]}}.
+    """
+    arrays = {}
+    for kind, params in models.items():
+        keys = np.array(list(params))
+        values = np.array(list(params.values()), dtype="float64").reshape(-1, 2)
+        order = np.argsort(keys, kind="stable")
+        arrays[f"{kind}_keys"] = keys[order]
+        arrays[f"{kind}_coef"] = values[order, 0]
+        arrays[f"{kind}_intercept"] = values[order, 1]
+    os.makedirs(MODEL_DIR, exist_ok=True)
+    np.savez(BUNDLE_PATH, **arrays)
+
+def load_models():
+    """Returns every array of the model bundle, {array name: array}, or {} before training."""
+    if not os.path.exists(BUNDLE_PATH):
+        return {}
+    with np.load(BUNDLE_PATH) as bundle:
+        return {name: bundle[name] for name in bundle.files}
+
+def bundle_version():
+    """Returns the modification time of the model bundle, or None before training."""
+    return os.path.getmtime(BUNDLE_PATH) if os.path.exists(BUNDLE_PATH) else None
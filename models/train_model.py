@@ -1,62 +1,99 @@
-import pandas as pd
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error
-import joblib
+import numpy as np
 import sys
 import os
-import re
 
-# Access the etl module from the data/ folder
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'data'))
-from etl import run_etl
+# Keep numba's compiled kernels in the project's cache directory, so every scheduled
+# run after the first loads them instead of compiling (must be set before numba is imported)
+os.environ.setdefault("NUMBA_CACHE_DIR", os.path.join(os.path.dirname(__file__), '..', 'cache', 'numba'))
+from numba import njit, prange, types
 
-def train_model(df, group_by_cols=None, name="global"):
+# Access the data package from the repository root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from data.etl import run_etl
+from model_store import BUNDLE_PATH, save_models
+
+# Explicit signature: compiled when the module loads (or loaded from the cache) rather than on first
+# call. x and y are read-only, as pandas (copy-on-write) hands out views of its columns
+@njit(types.void(types.int64[:], types.int64[:], types.int64[:],
+                 types.Array(types.float64, 1, "A", readonly=True), types.Array(types.float64, 1, "A", readonly=True),
+                 types.float64[:], types.float64[:], types.float64[:]),
+      cache=True, parallel=True, fastmath=True)
+def ols_per_group(starts, train_stops, stops, x, y, slope_out, intercept_out, mse_out):
     """
-    Trains a linear regression model and saves it.
+    Closed-form least squares of y on x for every group, one group per thread.
 
-    Args:
-        df (pd.DataFrame): The input DataFrame containing sales data.
-        group_by_cols (list, optional): Columns to group by. Defaults to None.
-        name (str, optional): The name for the model file. Defaults to "global".
+    Group g spans rows starts[g]:stops[g]; the line is fitted on the rows before
+    train_stops[g] and scored (mean squared error) on the rest.
     """
-    df = df.sort_values("month")
-    df["MonthIndex"] = pd.factorize(df["month"])[0]
+    for g in prange(starts.size):
+        s, t, e = starts[g], train_stops[g], stops[g]
+        xi, yi = x[s:t], y[s:t]
+        mx, my = xi.mean(), yi.mean()
+        slope = ((xi - mx) * (yi - my)).sum() / ((xi - mx) ** 2).sum()
+        intercept = my - slope * mx
+        slope_out[g], intercept_out[g] = slope, intercept
+        mse_out[g] = ((y[t:e] - (slope * x[t:e] + intercept)) ** 2).mean()
 
-    X = df[["MonthIndex"]]
-    y = df["TotalRevenue"]
+def train_models(df, key=None, name="global", min_points=5):
+    """
+    Trains a linear regression of revenue on month for every group and returns their parameters.
 
-    X_train, X_test, y_train, y_test = train_test_split(X, y, shuffle=False, test_size=0.2)
+    The first 80% of each group's months (chronologically) are fitted and the last
+    20% are scored, like train_test_split(shuffle=False, test_size=0.2). All groups
+    are fitted in one call to a compiled kernel instead of one sklearn fit each.
+    Only the coefficient followed by the intercept is kept, so the dashboard
+    can forecast without sklearn or unpickling an estimator.
 
-    model = LinearRegression()
-    model.fit(X_train, y_train)
+    Args:
+        df (pd.DataFrame): The input DataFrame containing sales data, ordered by key and
+            month with a per-group MonthIndex, as run_etl returns it.
+        key (str, optional): Column to train one model per value of. Defaults to None (a single model).
+        name (str, optional): The name of the model(s). Defaults to "global".
+        min_points (int, optional): Groups with fewer months are skipped. Defaults to 5.
 
-    y_pred = model.predict(X_test)
-    mse = mean_squared_error(y_test, y_pred)
-    print(f"✅ [{name}] Model trained. MSE: {mse:.2f}")
+    Returns:
+        dict: {group (or "global"): [coefficient, intercept]}.
+    """
+    if key is None:
+        keys, sizes = np.array(["global"]), np.array([len(df)])
+    else:
+        # run_etl orders the rows by key, then month, so every group is already one
+        # contiguous, chronological block and sort=False keeps the groups in that order
+        counts = df.groupby(key, observed=True, sort=False).size()
+        keys, sizes = counts.index.to_numpy(), counts.to_numpy()
 
-    # Save the model
-    os.makedirs("models", exist_ok=True)
-    filename = f"models/{name}_model.pkl"
-    joblib.dump(model, filename)
-    print(f"📦 Model saved to {filename}\n")
+    stops = np.cumsum(sizes)
+    starts = stops - sizes
+    trained = sizes >= min_points # Train only if there are at least min_points data points
+    keys, starts, stops, sizes = keys[trained], starts[trained], stops[trained], sizes[trained]
+    train_stops = stops - np.ceil(sizes * 0.2).astype(np.int64)
+
+    slope, intercept, mse = (np.empty(keys.size) for _ in range(3))
+    ols_per_group(starts.astype(np.int64), train_stops, stops.astype(np.int64),
+                  df["MonthIndex"].to_numpy("float64"), df["TotalRevenue"].to_numpy("float64"),
+                  slope, intercept, mse)
+
+    models = {}
+    for group, coef, icpt, err in zip(keys.tolist(), slope.tolist(), intercept.tolist(), mse.tolist()):
+        model_name = name if key is None else f"{name}_{group}"
+        print(f"✅ [{model_name}] Model trained. MSE: {err:.2f}")
+        # Model parameters: coefficient followed by the intercept
+        models[group] = [coef, icpt]
+    return models
 
 if __name__ == "__main__":
-    monthly_sales_df, monthly_customer_df, monthly_product_df = run_etl()
-
-    # Train a global model on all sales data
-    train_model(monthly_sales_df, name="global")
-
-    # Train a separate model for each customer with sufficient data
-    for customer_id in monthly_customer_df["CustomerID"].unique():
-        cust_df = monthly_customer_df[monthly_customer_df["CustomerID"] == customer_id]
-        if len(cust_df) >= 5: # Train only if there are at least 5 data points
-            train_model(cust_df, name=f"customer_{int(customer_id)}")
-
-    # Train a separate model for each product with sufficient data
-    for desc in monthly_product_df["Description"].unique():
-        prod_df = monthly_product_df[monthly_product_df["Description"] == desc]
-        if len(prod_df) >= 5: # Train only if there are at least 5 data points
-            # Create a filesystem-safe name from the product description
-            safe_name = re.sub(r'[^a-zA-Z0-9_]', '_', desc.lower())[:50]
-            train_model(prod_df, name=f"product_{safe_name}")
\ No newline at end of file
+    monthly_sales_df, monthly_customer_df, monthly_product_df = run_etl(persist_star_schema=False)
+
+    models = {
+        # Train a global model on all sales data
+        # (with as few as 3 months: the smallest series whose 80/20 split leaves two months to fit)
+        "global": train_models(monthly_sales_df, name="global", min_points=3),
+        # Train a separate model for each customer with sufficient data
+        "customer": train_models(monthly_customer_df, "CustomerID", name="customer"),
+        # Train a separate model for each product with sufficient data
+        "product": train_models(monthly_product_df, "Description", name="product"),
+    }
+
+    # Pack every model's parameters into one bundle
+    save_models(models)
+    print(f"📦 {sum(map(len, models.values()))} models saved to {BUNDLE_PATH}")
@@ -0,0 +1,180 @@
+import streamlit as st
+import plotly.express as px
+from common import (setup_page, load_sales, calculate_growth_metrics, create_time_series_chart,
+                    display_metrics_card, format_large_number, format_large_numbers)
+
+setup_page()
+
+# Load data
+monthly_sales_df, global_forecast, sales_insights = load_sales()
+
+# ======== Global Sales Page ========
+st.header("🌐 Global Monthly Sales Analysis")
+
+# Create columns for metrics
+col1, col2, col3, col4 = st.columns(4)
+
+# Calculate key metrics
+total_revenue = sales_insights["sum"]
+avg_monthly_revenue = sales_insights["mean"]
+
+# Growth metrics
+growth_pct, growth_abs, trend = calculate_growth_metrics(monthly_sales_df["TotalRevenue"].to_numpy())
+
+# Display metrics with formatting
+with col1:
+    display_metrics_card(
+        "Total Revenue", 
+        format_large_number(total_revenue),
+        0
+    )
+
+with col2:
+    display_metrics_card(
+        "Avg Monthly Revenue", 
+        format_large_number(avg_monthly_revenue),
+        0
+    )
+
+with col3:
+    display_metrics_card(
+        "Last Month Revenue", 
+        format_large_number(sales_insights["last"]), 
+        growth_pct
+    )
+
+with col4:
+    # Calculate YoY growth if we have enough data (at least 13 months)
+    if sales_insights["year_ago"] is not None:
+        current_month = sales_insights["last"]
+        year_ago_month = sales_insights["year_ago"]
+        yoy_change = ((current_month - year_ago_month) / year_ago_month) * 100
+        display_metrics_card("YoY Growth", f"{yoy_change:.2f}%", yoy_change, "vs last year")
+    else:
+        display_metrics_card("Month-over-Month", f"{growth_pct:.2f}%", growth_pct)
+
+st.markdown("""<hr style='margin: 15px 0px; border: 1px solid #5a5a5a'>""", unsafe_allow_html=True)
+
+# Create two columns for main chart and insights
+chart_col, insights_col = st.columns([7, 3])
+
+with chart_col:
+    # Create enhanced time series visualization
+    fig = create_time_series_chart(
+        monthly_sales_df, 
+        "Month", 
+        "TotalRevenue", 
+        "Monthly Sales Trends"
+    )
+    
+    # Display the chart
+    st.plotly_chart(fig, use_container_width=True)
+
+with insights_col:
+    st.markdown("### 📈 Sales Insights")
+    
+    # Peak and low analysis
+    max_month, max_value = monthly_sales_df["Month"].iloc[sales_insights["peak_idx"]], sales_insights["peak"]
+    min_month, min_value = monthly_sales_df["Month"].iloc[sales_insights["low_idx"]], sales_insights["low"]
+    
+    # Display insights
+    st.markdown("""<div class='insight-container'>
+        <strong>🔹 Peak Sales</strong><br>
+        {peak_month}: {peak_value}
+        </div>""".format(
+            peak_month=max_month,
+            peak_value=format_large_number(max_value)
+        ), unsafe_allow_html=True)
+    
+    st.markdown("""<div class='insight-container'>
+        <strong>🔹 Lowest Sales</strong><br>
+        {low_month}: {low_value}
+        </div>""".format(
+            low_month=min_month,
+            low_value=format_large_number(min_value)
+        ), unsafe_allow_html=True)
+        
+    # Average monthly growth rate
+    avg_growth_rate = sales_insights["avg_growth_rate"]
+    if avg_growth_rate is not None:
+        growth_trend = "Positive" if avg_growth_rate > 0 else "Negative"
+        
+        st.markdown("""<div class='insight-container'>
+            <strong>🔹 Average Growth</strong><br>
+            {rate:.2f}% per month<br>
+            <span style='color: {color};'>{trend}</span> overall trend
+            </div>""".format(
+                rate=avg_growth_rate,
+                trend=growth_trend,
+                color="#00CC96" if avg_growth_rate > 0 else "#EF553B"
+            ), unsafe_allow_html=True)
+
+# Forecast section
+st.markdown("""<hr style='margin: 15px 0px; border: 1px solid #5a5a5a'>""", unsafe_allow_html=True)
+st.subheader("📊 Sales Forecast")
+
+prediction = global_forecast
+if prediction is not None:
+    
+    # Calculate confidence interval (simple approach)
+    current_std = sales_insights["std"]
+    lower_bound = max(0, prediction - 1.96 * current_std)
+    upper_bound = prediction + 1.96 * current_std
+    
+    # Show forecast with confidence interval
+    forecast_col1, forecast_col2, forecast_col3 = st.columns(3)
+    with forecast_col1:
+        st.metric("Forecast Value", f"£{prediction:,.2f}")
+    
+    with forecast_col2:
+        st.metric("Lower Bound (95%)", f"£{lower_bound:,.2f}")
+        
+    with forecast_col3:
+        st.metric("Upper Bound (95%)", f"£{upper_bound:,.2f}")
+    
+    # Forecast interpretation
+    last_month_value = sales_insights["last"]
+    forecast_change = ((prediction - last_month_value) / last_month_value) * 100
+    
+    if forecast_change > 0:
+        forecast_message = f"🔼 Revenue is forecast to **increase by {forecast_change:.2f}%** next month."
+    elif forecast_change < 0:
+        forecast_message = f"🔽 Revenue is forecast to **decrease by {abs(forecast_change):.2f}%** next month."
+    else:
+        forecast_message = "➡️ Revenue is forecast to remain stable next month."
+        
+    st.markdown(f"""
+    <div style='background-color:#1F4E79; padding:10px; border-radius:5px;'>
+        <h4 style='margin-top:0;'>Forecast Analysis</h4>
+        <p>{forecast_message}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+else:
+    st.warning("⚠️ Sales forecast model not found. Please train the model first for predictive analytics.")
+    
+# Historical Monthly Distribution
+st.markdown("""<hr style='margin: 15px 0px; border: 1px solid #5a5a5a'>""", unsafe_allow_html=True)
+st.subheader("📊 Monthly Revenue Distribution")
+
+monthly_dist_fig = px.bar(
+    monthly_sales_df, 
+    x='MonthName', 
+    y='TotalRevenue',
+    color='Year',
+    text=format_large_numbers(monthly_sales_df['TotalRevenue']),
+    title='Revenue by Month',
+    labels={'TotalRevenue': 'Revenue', 'MonthName': 'Month'},
+    # Calendar order, not the order months first appear in the data
+    category_orders={'MonthName': list(monthly_sales_df['MonthName'].cat.categories)},
+    template="plotly_dark"
+)
+
+monthly_dist_fig.update_layout(
+    xaxis_title="Month",
+    yaxis_title="Revenue",
+    legend_title="Year",
+    height=400
+)
+
+st.plotly_chart(monthly_dist_fig, use_container_width=True)
@@ -0,0 +1,180 @@
+import streamlit as st
+import numpy as np
+import plotly.express as px
+from common import (setup_page, load_customer, calculate_growth_metrics, create_time_series_chart,
+                    format_large_number, month_label)
+
+setup_page()
+
+# Load data
+(monthly_customer_df, customer_rows, customer_totals, customer_options,
+ customer_ranks, customer_forecasts) = load_customer()
+
+# ======== Per Customer Page ========
+@st.fragment
+def customer_view():
+    """Customer selection, metrics and forecast, rerun on their own when the selection changes"""
+    # Main content area
+    customer_col1, customer_col2 = st.columns([1, 3])
+    
+    # Customer selection with improved UX
+    with customer_col1:
+        # Add customer selection with search, customers ordered by value
+        st.markdown("### Select Customer")
+        selected_id = st.selectbox(
+            "Customer ID", 
+            customer_options,
+            format_func=lambda x: f"Customer {int(x)}",
+            help="Select a customer to view their detailed sales performance"
+        )
+    
+    # Get customer specific data
+    cust_df = monthly_customer_df.iloc[customer_rows[selected_id]]
+    
+    # Calculate customer metrics
+    customer_total = cust_df["TotalRevenue"].sum()
+    customer_avg = cust_df["TotalRevenue"].mean()
+    customer_growth_pct, _, customer_trend = calculate_growth_metrics(cust_df["TotalRevenue"].to_numpy())
+    
+    # Display customer metrics
+    with customer_col1:
+        st.markdown("### Customer Metrics")
+        st.metric("Total Spent", format_large_number(customer_total))
+        st.metric("Avg Monthly Spend", format_large_number(customer_avg))
+        st.metric("Recent Growth", f"{customer_growth_pct:.2f}%", delta=customer_growth_pct)
+        
+        # Customer ranking
+        customer_rank = customer_ranks[selected_id]
+        percentile = (1 - (customer_rank / total_customers)) * 100
+        
+        st.markdown(f"""
+        <div class='insight-container'>
+            <strong>Customer Ranking</strong><br>
+            #{customer_rank} of {total_customers} customers<br>
+            <span style='color:#00CC96'>Top {percentile:.1f}%</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Customer time series analysis
+    with customer_col2:
+        st.markdown("### Customer Sales Trend")
+        
+        # Create enhanced time series chart for this customer
+        cust_fig = create_time_series_chart(
+            cust_df, 
+            "Month", 
+            "TotalRevenue", 
+            f"Monthly Sales for Customer {int(selected_id)}"
+        )
+        
+        # Display the chart
+        st.plotly_chart(cust_fig, use_container_width=True)
+    
+    st.markdown("""<hr style='margin: 15px 0px; border: 1px solid #5a5a5a'>""", unsafe_allow_html=True)
+    
+    # Customer forecast section
+    st.subheader("Customer Sales Forecast")
+    fcst_col1, fcst_col2 = st.columns([3, 2])
+    
+    with fcst_col1:
+        # Display model prediction if available
+        prediction = customer_forecasts.get(selected_id)
+        if prediction is not None:
+            
+            # Create forecast visualization: extend the history arrays by the
+            # forecast point instead of copying the frame to append a row
+            next_month = month_label(int(cust_df["MonthNum"].iloc[-1]) + 1)
+            
+            # Create forecast chart with confidence interval
+            forecast_fig = px.line(
+                x=np.append(cust_df["Month"].to_numpy(), next_month), 
+                y=np.append(cust_df["TotalRevenue"].to_numpy(), prediction),
+                labels={"x": "Month", "y": "TotalRevenue"},
+                markers=True,
+                render_mode="webgl",
+                template="plotly_dark"
+            )
+            
+            # Highlight the forecast point
+            forecast_fig.add_scattergl(
+                x=[next_month], 
+                y=[prediction],
+                mode='markers',
+                marker=dict(size=15, color='#FF9914', symbol='diamond'),
+                name='Forecast'
+            )
+            
+            # Add confidence interval
+            std_dev = cust_df["TotalRevenue"].std()
+            forecast_fig.add_scattergl(
+                x=[next_month, next_month],
+                y=[max(0, prediction - 1.96 * std_dev), prediction + 1.96 * std_dev],
+                mode='lines',
+                line=dict(width=2, color='#FF9914', dash='dot'),
+                name='95% Confidence'
+            )
+            
+            forecast_fig.update_layout(
+                title=f"Revenue Forecast for Customer {int(selected_id)}",
+                xaxis_title="Month",
+                yaxis_title="Revenue",
+                height=350
+            )
+            
+            st.plotly_chart(forecast_fig, use_container_width=True)
+        else:
+            st.warning("⚠️ No forecast model available for this customer.")
+    
+    with fcst_col2:
+        if prediction is not None:
+            # Calculate forecast metrics
+            last_value = cust_df["TotalRevenue"].iloc[-1]
+            forecast_change = ((prediction - last_value) / last_value * 100) if last_value != 0 else 0
+            
+            st.markdown("### Forecast Details")
+            st.metric("Next Month Forecast", f"£{prediction:,.2f}")
+            st.metric(
+                "Expected Change", 
+                f"{forecast_change:.2f}%", 
+                delta=forecast_change,
+                delta_color="normal" if forecast_change >= 0 else "inverse"
+            )
+            
+            # Forecast interpretation
+            trend_message = "increasing" if forecast_change > 0 else "decreasing" if forecast_change < 0 else "stable"
+            action_needed = "maintain engagement" if forecast_change >= 0 else "investigate and address potential issues"
+            
+            st.markdown(f"""
+            <div class='insight-container'>
+                <strong>Forecast Insight</strong><br>
+                Customer revenue is {trend_message}. Recommendation: {action_needed}.
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Customer lifetime value (simple calculation)
+            if len(cust_df) >= 3:
+                cltv = customer_avg * 12  # Simple annual value
+                st.markdown(f"""
+                <div class='insight-container'>
+                    <strong>Est. Annual Value</strong><br>
+                    {format_large_number(cltv)}
+                </div>
+                """, unsafe_allow_html=True)
+
+st.header("👤 Customer Sales Analysis")
+
+# Dashboard filters in sidebar
+st.sidebar.header("Customer Filters")
+
+# Calculated metrics for all customers
+total_customers = len(customer_totals)
+avg_revenue_per_customer = customer_totals.mean()
+
+# Display customer overview metrics
+st.sidebar.markdown(f"""
+### Customer Overview
+- **Total Customers:** {total_customers}
+- **Avg Revenue/Customer:** {format_large_number(avg_revenue_per_customer)}
+""")
+
+customer_view()
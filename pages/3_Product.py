@@ -0,0 +1,197 @@
+import streamlit as st
+import numpy as np
+import plotly.express as px
+from common import (setup_page, load_product, calculate_growth_metrics, create_time_series_chart,
+                    format_large_number, month_label)
+
+setup_page()
+
+# Load data
+(monthly_product_df, product_rows, product_totals, product_options,
+ product_ranks, product_forecasts) = load_product()
+
+# ======== Per Product Page ========
+@st.fragment
+def product_view():
+    """Product selection, metrics and forecast, rerun on their own when the selection changes"""
+    # Main content area
+    product_col1, product_col2 = st.columns([1, 3])
+    
+    # Product selection with improved UX
+    with product_col1:
+        # Add product selection with search, products ordered by revenue
+        st.markdown("### Select Product")
+        selected_prod = st.selectbox(
+            "Product", 
+            product_options,
+            help="Select a product to view its detailed sales performance"
+        )
+    
+    # Get product specific data
+    prod_df = monthly_product_df.iloc[product_rows[selected_prod]]
+    
+    # Calculate product metrics
+    product_total = prod_df["TotalRevenue"].sum()
+    product_avg = prod_df["TotalRevenue"].mean()
+    product_growth_pct, _, product_trend = calculate_growth_metrics(prod_df["TotalRevenue"].to_numpy())
+    
+    # Display product metrics
+    with product_col1:
+        st.markdown("### Product Metrics")
+        st.metric("Total Revenue", format_large_number(product_total))
+        st.metric("Avg Monthly Revenue", format_large_number(product_avg))
+        st.metric("Recent Growth", f"{product_growth_pct:.2f}%", delta=product_growth_pct)
+        
+        # Product ranking
+        product_rank = product_ranks[selected_prod]
+        percentile = (1 - (product_rank / total_products)) * 100
+        
+        st.markdown(f"""
+        <div class='insight-container'>
+            <strong>Product Ranking</strong><br>
+            #{product_rank} of {total_products} products<br>
+            <span style='color:#00CC96'>Top {percentile:.1f}%</span>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Product time series analysis
+    with product_col2:
+        st.markdown("### Product Sales Trend")
+        
+        # Create enhanced time series chart for this product
+        prod_fig = create_time_series_chart(
+            prod_df, 
+            "Month", 
+            "TotalRevenue", 
+            f"Monthly Sales for {selected_prod}"
+        )
+        
+        # Display the chart
+        st.plotly_chart(prod_fig, use_container_width=True)
+    
+    st.markdown("""<hr style='margin: 15px 0px; border: 1px solid #5a5a5a'>""", unsafe_allow_html=True)
+    
+    # Product forecast section
+    st.subheader("Product Sales Forecast")
+    prod_fcst_col1, prod_fcst_col2 = st.columns([3, 2])
+    
+    with prod_fcst_col1:
+        # Display model prediction if available
+        prediction = product_forecasts.get(selected_prod)
+        if prediction is not None:
+            
+            # Create forecast visualization: extend the history arrays by the
+            # forecast point instead of copying the frame to append a row
+            next_month = month_label(int(prod_df["MonthNum"].iloc[-1]) + 1)
+            
+            # Create forecast chart with confidence interval
+            forecast_fig = px.line(
+                x=np.append(prod_df["Month"].to_numpy(), next_month), 
+                y=np.append(prod_df["TotalRevenue"].to_numpy(), prediction),
+                labels={"x": "Month", "y": "TotalRevenue"},
+                markers=True,
+                render_mode="webgl",
+                template="plotly_dark"
+            )
+            
+            # Highlight the forecast point
+            forecast_fig.add_scattergl(
+                x=[next_month], 
+                y=[prediction],
+                mode='markers',
+                marker=dict(size=15, color='#FF9914', symbol='diamond'),
+                name='Forecast'
+            )
+            
+            # Add confidence interval
+            std_dev = prod_df["TotalRevenue"].std()
+            forecast_fig.add_scattergl(
+                x=[next_month, next_month],
+                y=[max(0, prediction - 1.96 * std_dev), prediction + 1.96 * std_dev],
+                mode='lines',
+                line=dict(width=2, color='#FF9914', dash='dot'),
+                name='95% Confidence'
+            )
+            
+            forecast_fig.update_layout(
+                title=f"Revenue Forecast for {selected_prod}",
+                xaxis_title="Month",
+                yaxis_title="Revenue",
+                height=350
+            )
+            
+            st.plotly_chart(forecast_fig, use_container_width=True)
+        else:
+            st.warning("⚠️ No forecast model available for this product.")
+    
+    with prod_fcst_col2:
+        if prediction is not None:
+            # Calculate forecast metrics
+            last_value = prod_df["TotalRevenue"].iloc[-1]
+            forecast_change = ((prediction - last_value) / last_value * 100) if last_value != 0 else 0
+            
+            st.markdown("### Forecast Details")
+            st.metric("Next Month Forecast", f"£{prediction:,.2f}")
+            st.metric(
+                "Expected Change", 
+                f"{forecast_change:.2f}%", 
+                delta=forecast_change,
+                delta_color="normal" if forecast_change >= 0 else "inverse"
+            )
+            
+            # Product performance insights
+            if forecast_change > 10:
+                product_status = "High growth potential"
+                recommendation = "Consider increasing inventory and promotion"
+            elif forecast_change > 0:
+                product_status = "Stable growth"
+                recommendation = "Maintain current strategy"
+            elif forecast_change > -10:
+                product_status = "Slight decline"
+                recommendation = "Monitor closely"
+            else:
+                product_status = "Significant decline"
+                recommendation = "Review pricing or consider promotional campaign"
+            
+            st.markdown(f"""
+            <div class='insight-container'>
+                <strong>Product Status:</strong> {product_status}<br>
+                <strong>Recommendation:</strong> {recommendation}
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Seasonality check (simple implementation)
+            if len(prod_df) >= 6:
+                months = prod_df["MonthNum"] % 12 + 1
+                month_avg = prod_df.groupby(months)["TotalRevenue"].mean()
+                max_month = month_avg.idxmax()
+                min_month = month_avg.idxmin()
+                
+                month_names = {1:"January", 2:"February", 3:"March", 4:"April", 5:"May", 6:"June", 
+                              7:"July", 8:"August", 9:"September", 10:"October", 11:"November", 12:"December"}
+                
+                st.markdown(f"""
+                <div class='insight-container'>
+                    <strong>Seasonal Analysis</strong><br>
+                    Best month: {month_names[max_month]}<br>
+                    Worst month: {month_names[min_month]}
+                </div>
+                """, unsafe_allow_html=True)
+
+st.header("📦 Product Sales Analysis")
+
+# Dashboard filters in sidebar
+st.sidebar.header("Product Filters")
+
+# Product overview metrics
+total_products = len(product_totals)
+avg_revenue_per_product = product_totals.mean()
+
+# Display product overview metrics
+st.sidebar.markdown(f"""
+### Product Overview
+- **Total Products:** {total_products}
+- **Avg Revenue/Product:** {format_large_number(avg_revenue_per_product)}
+""")
+
+product_view()
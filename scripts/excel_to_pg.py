@@ -1,15 +1,21 @@
 import pandas as pd
-from sqlalchemy import create_engine
-from dotenv import load_dotenv
 import os
+import sys
 
-# Load .env
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
+# Access the data package from the repository root
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from data.db import bulk_copy, engine
 
-# Load Excel
-df = pd.read_excel("data/Online Retail.xlsx")
+# Load Excel with the native calamine parser. Text columns are Arrow-backed rather than
+# Python objects, Country repeats a few dozen values, and CustomerID has blanks, so read it as nullable
+df = pd.read_excel("data/Online Retail.xlsx", engine="calamine", dtype={
+    "InvoiceNo": "string[pyarrow]",
+    "StockCode": "string[pyarrow]",
+    "Description": "string[pyarrow]",
+    "Country": "category",
+    "CustomerID": "Int64",
+    "Quantity": "int32",
+})
 
 # Drop rows where essential columns are empty
 required_columns = ["InvoiceNo", "StockCode", "Description", "Quantity", "InvoiceDate", "UnitPrice", "CustomerID"]
@@ -21,17 +27,17 @@ df["CustomerID"] = df["CustomerID"].astype(int)
 
 # Insert into the sales table
 try:
-    df.to_sql("sales", engine, if_exists="replace", index=False)
+    bulk_copy(df, "sales", engine, if_exists="replace")
     print(f"✅ Inserted {len(df)} rows to 'sales'")
 except Exception as e:
     print("❌ Error inserting into 'sales':", e)
 
-# Insert into the sales_log table (with additional columns)
+# Insert into the sales_log table (with additional columns), added to the same frame
+# rather than a copy of it so the rows are held in memory only once
 try:
-    df_log = df.copy()
-    df_log["inserted_at"] = pd.Timestamp.now()
-    df_log["source"] = "initial_import"
-    df_log.to_sql("sales_log", engine, if_exists="replace", index=False)
-    print(f"✅ Inserted {len(df_log)} rows to 'sales_log'")
+    df["inserted_at"] = pd.Timestamp.now()
+    df["source"] = "initial_import"
+    bulk_copy(df, "sales_log", engine, if_exists="replace")
+    print(f"✅ Inserted {len(df)} rows to 'sales_log'")
 except Exception as e:
     print("❌ Error inserting into 'sales_log':", e)
\ No newline at end of file